@@ -3,12 +3,10 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-import matplotlib.pyplot as plt
-import seaborn as sns
+import pydeck as pdk
+import io
+import os
 from datetime import datetime
-import folium
-from streamlit_folium import folium_static
-from scipy import stats
 
 # Page configuration
 st.set_page_config(
@@ -18,58 +16,105 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+CSV_FILE = "Last mile Delivery Data.csv"
+PARQUET_CACHE = "delivery_clean.parquet"
+
+# Haversine kernel - with Numba installed the whole computation fuses
+# into one parallel loop with no temporary arrays; otherwise fall back
+# to the NumPy broadcast version. Inputs are coordinate arrays in radians.
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _haversine_km(lat1, lon1, lat2, lon2):
+        n = lat1.shape[0]
+        out = np.empty(n)
+        for i in prange(n):
+            dlat = lat2[i] - lat1[i]
+            dlon = lon2[i] - lon1[i]
+            a = np.sin(dlat/2)**2 + np.cos(lat1[i]) * np.cos(lat2[i]) * np.sin(dlon/2)**2
+            out[i] = 6371 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))  # Earth radius in km
+        return out
+except ImportError:
+    def _haversine_km(lat1, lon1, lat2, lon2):
+        dlat = lat2 - lat1
+        dlon = lon2 - lon1
+        a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+        return 6371 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))  # Earth radius in km
+
 @st.cache_data
 def load_data():
     try:
-        # Load your original dataset
-        df = pd.read_csv("Last mile Delivery Data.csv")
-        
+        # Warm start: reuse the cleaned Parquet written on a previous run,
+        # as long as the CSV hasn't changed since
+        if os.path.exists(PARQUET_CACHE) and os.path.getmtime(PARQUET_CACHE) > os.path.getmtime(CSV_FILE):
+            df = pd.read_parquet(PARQUET_CACHE)
+            st.sidebar.success(f"✅ Loaded {len(df)} records from cache")
+            return df
+
+        # Load your original dataset - pyarrow engine parses in parallel,
+        # and setting dtypes on read skips the separate coercion passes
+        df = pd.read_csv(
+            CSV_FILE,
+            engine='pyarrow',
+            dtype={
+                'Weather': 'category',
+                'Traffic': 'category',
+                'Vehicle': 'category',
+                'Area': 'category',
+                'Category': 'category',
+                'Agent_Rating': 'float32'
+            },
+            parse_dates=['Order_Date']
+        )
+
         st.sidebar.success(f"✅ Loaded {len(df)} records from CSV")
-        
-        # Basic cleaning for your specific dataset
-        df['Order_Date'] = pd.to_datetime(df['Order_Date'])
-        
+
         # Fix any data issues from your dataset
-        df['Agent_Rating'] = pd.to_numeric(df['Agent_Rating'], errors='coerce')
         df['Agent_Rating'] = df['Agent_Rating'].fillna(df['Agent_Rating'].median())
-        
+
+        # Fill missing filter values with an explicit 'Unknown' category.
+        # NaN identity doesn't survive the st.cache_data pickle round-trip,
+        # so a nan in both options and default would crash the multiselects;
+        # a real category also keeps those rows selectable in the filters.
+        for col in ['Weather', 'Traffic', 'Vehicle', 'Area', 'Category']:
+            if df[col].isna().any():
+                df[col] = df[col].cat.add_categories('Unknown').fillna('Unknown')
+
         # Standardize column names if needed
         df.columns = df.columns.str.strip()
         
         # Add Distance_km column if you have coordinates
         if all(col in df.columns for col in ['Store_Latitude', 'Store_Longitude', 'Drop_Latitude', 'Drop_Longitude']):
-            from math import radians, sin, cos, sqrt, atan2
-            
-            def calculate_distance(lat1, lon1, lat2, lon2):
-                R = 6371  # Earth radius in km
-                lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-                dlat = lat2 - lat1
-                dlon = lon2 - lon1
-                a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-                c = 2 * atan2(sqrt(a), sqrt(1-a))
-                return R * c
-            
-            df['Distance_km'] = df.apply(
-                lambda row: calculate_distance(
-                    row['Store_Latitude'], row['Store_Longitude'],
-                    row['Drop_Latitude'], row['Drop_Longitude']
-                ), axis=1
+            df['Distance_km'] = _haversine_km(
+                np.radians(df['Store_Latitude'].to_numpy()),
+                np.radians(df['Store_Longitude'].to_numpy()),
+                np.radians(df['Drop_Latitude'].to_numpy()),
+                np.radians(df['Drop_Longitude'].to_numpy())
             )
         else:
             df['Distance_km'] = 5.0  # placeholder
         
-        # Add required calculated columns
-        df['Pickup_Delay'] = 15  # Placeholder - calculate actual delay if you have times
-        
-        # Categorize delivery times
-        df['Delivery_Type'] = pd.cut(
-            df['Delivery_Time'],
-            bins=[0, 60, 120, float('inf')],
-            labels=['Fast', 'Medium', 'Slow']
-        )
-        
+        # Categorize delivery times - searchsorted is a vectorized binary
+        # search, cheaper than pd.cut's interval machinery
+        codes = np.searchsorted([60, 120], df['Delivery_Time'].to_numpy(), side='left')
+        df['Delivery_Type'] = pd.Categorical.from_codes(codes, categories=['Fast', 'Medium', 'Slow'])
+
+        # Downcast numerics - float32/int32 halves the memory of these
+        # columns and speeds up the aggregations that scan them
+        for col in ['Delivery_Time', 'Agent_Age', 'Agent_Rating']:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], downcast='float' if df[col].dtype.kind == 'f' else 'integer')
+        # to_numeric refuses the lossy Distance_km downcast, so cast it
+        # explicitly - float32 is metre-level precision at these magnitudes
+        df['Distance_km'] = df['Distance_km'].astype(np.float32)
+
+        # Persist the cleaned frame so the next cold start skips the
+        # CSV parse and distance computation
+        df.to_parquet(PARQUET_CACHE, compression='zstd')
+
         return df
-        
+
     except FileNotFoundError:
         st.error("❌ CSV file not found! Make sure 'Last mile Delivery Data.csv' is in the same folder.")
         return pd.DataFrame()
@@ -94,6 +139,11 @@ if df.empty:
 st.sidebar.header("🔍 Filters")
 st.sidebar.markdown("---")
 
+# Option lists are identical until the data changes - cache them
+@st.cache_data
+def col_unique(col_name):
+    return df[col_name].unique().tolist()
+
 # Date range filter
 min_date = df['Order_Date'].min()
 max_date = df['Order_Date'].max()
@@ -107,67 +157,141 @@ date_range = st.sidebar.date_input(
 # Dynamic filters
 weather_options = st.sidebar.multiselect(
     "Weather Conditions",
-    options=df['Weather'].unique(),
-    default=df['Weather'].unique()
+    options=col_unique('Weather'),
+    default=col_unique('Weather')
 )
 
 traffic_options = st.sidebar.multiselect(
     "Traffic Levels",
-    options=df['Traffic'].unique(),
-    default=df['Traffic'].unique()
+    options=col_unique('Traffic'),
+    default=col_unique('Traffic')
 )
 
 vehicle_options = st.sidebar.multiselect(
     "Vehicle Types",
-    options=df['Vehicle'].unique(),
-    default=df['Vehicle'].unique()
+    options=col_unique('Vehicle'),
+    default=col_unique('Vehicle')
 )
 
 area_options = st.sidebar.multiselect(
     "Area Types",
-    options=df['Area'].unique(),
-    default=df['Area'].unique()
+    options=col_unique('Area'),
+    default=col_unique('Area')
 )
 
 category_options = st.sidebar.multiselect(
     "Product Categories",
-    options=df['Category'].unique(),
-    default=df['Category'].unique()
+    options=col_unique('Category'),
+    default=col_unique('Category')
 )
 
-# Apply filters
-filtered_df = df[
-    (df['Weather'].isin(weather_options)) &
-    (df['Traffic'].isin(traffic_options)) &
-    (df['Vehicle'].isin(vehicle_options)) &
-    (df['Area'].isin(area_options)) &
-    (df['Category'].isin(category_options)) &
-    (df['Order_Date'] >= pd.to_datetime(date_range[0])) &
-    (df['Order_Date'] <= pd.to_datetime(date_range[1]))
-]
+# Apply filters - cached so reruns with the same selections skip the full scan.
+# The categorical columns are matched on their integer codes, which avoids
+# object-dtype string comparisons per row.
+@st.cache_data
+def compute_filtered(weather_tup, traffic_tup, vehicle_tup, area_tup, category_tup, d0, d1):
+    mask = np.ones(len(df), dtype=bool)
+    for col, selected in (
+        ('Weather', weather_tup),
+        ('Traffic', traffic_tup),
+        ('Vehicle', vehicle_tup),
+        ('Area', area_tup),
+        ('Category', category_tup)
+    ):
+        allowed_codes = df[col].cat.categories.get_indexer(list(selected))
+        mask &= np.isin(df[col].cat.codes.to_numpy(), allowed_codes)
+    order_dates = df['Order_Date'].to_numpy()
+    mask &= (order_dates >= np.datetime64(d0)) & (order_dates <= np.datetime64(d1))
+    return df[mask]
+
+filtered_df = compute_filtered(
+    tuple(weather_options),
+    tuple(traffic_options),
+    tuple(vehicle_options),
+    tuple(area_options),
+    tuple(category_options),
+    date_range[0],
+    date_range[1]
+)
+
+# All per-tab aggregates in one cached pass over the filtered frame
+@st.cache_data
+def compute_all_aggs(filtered):
+    category_stats = filtered.groupby('Category', observed=True).agg({
+        'Delivery_Time': ['mean', 'count'],
+        'Agent_Rating': 'mean'
+    }).round(2)
+    category_stats.columns = ['Avg_Delivery_Time', 'Order_Count', 'Avg_Rating']
+    category_stats = category_stats.sort_values('Avg_Delivery_Time', ascending=False)
+
+    return {
+        'category': category_stats,
+        'weather': filtered.groupby('Weather', observed=True)['Delivery_Time'].mean().sort_values(ascending=False),
+        'traffic': filtered.groupby('Traffic', observed=True)['Delivery_Time'].mean().sort_values(ascending=False),
+        'vehicle': filtered.groupby('Vehicle', observed=True)['Delivery_Time'].mean(),
+        'area': filtered.groupby('Area', observed=True).agg({
+            'Delivery_Time': 'mean',
+            'Agent_Rating': 'mean',
+            'Order_ID': 'count'
+        }).rename(columns={'Order_ID': 'Order_Count'}).round(2),
+        'heatmap': filtered.pivot_table(
+            values='Delivery_Time',
+            index='Weather',
+            columns='Traffic',
+            aggfunc='mean',
+            observed=True
+        ).fillna(0)
+    }
+
+@st.cache_data
+def compute_agent_efficiency(filtered):
+    efficiency = filtered.groupby('Agent_Age', observed=True).agg(
+        Delivery_Time=('Delivery_Time', 'mean'),
+        Agent_Rating=('Agent_Rating', 'mean'),
+        Total_Orders=('Order_ID', 'count'),
+        Avg_Distance_km=('Distance_km', 'mean')
+    )
+    efficiency['Efficiency_Score'] = efficiency['Delivery_Time'] / efficiency['Avg_Distance_km']
+    return efficiency.sort_values('Efficiency_Score')
+
+aggs = compute_all_aggs(filtered_df)
+
+# Cap the number of points sent to the browser for scatter plots
+MAX_SCATTER_POINTS = 5000
+
+@st.cache_data
+def scatter_sample(filtered):
+    if len(filtered) > MAX_SCATTER_POINTS:
+        return filtered.sample(MAX_SCATTER_POINTS, random_state=0)
+    return filtered
+
+scatter_df = scatter_sample(filtered_df)
 
 # Main app
 st.title("🚚 Last-Mile Delivery Performance Dashboard")
 st.markdown("---")
 
-# KPI Cards
+# KPI Cards - computed on the raw ndarrays, no intermediate Series
 st.subheader("📊 Key Performance Indicators")
 col1, col2, col3, col4 = st.columns(4)
 
+delivery_times = filtered_df['Delivery_Time'].to_numpy()
+
 with col1:
     total_orders = len(filtered_df)
     st.metric("Total Orders", f"{total_orders:,}")
 
 with col2:
-    avg_delivery_time = filtered_df['Delivery_Time'].mean()
+    avg_delivery_time = delivery_times.mean() if delivery_times.size else 0.0
     st.metric("Avg Delivery Time", f"{avg_delivery_time:.1f} min")
 
 with col3:
-    on_time_rate = (filtered_df['Delivery_Time'] <= 60).mean() * 100
+    on_time_rate = np.count_nonzero(delivery_times <= 60) / delivery_times.size * 100 if delivery_times.size else 0.0
     st.metric("On-Time Rate", f"{on_time_rate:.1f}%")
 
 with col4:
-    avg_rating = filtered_df['Agent_Rating'].mean()
+    ratings = filtered_df['Agent_Rating'].to_numpy()
+    avg_rating = ratings.mean() if ratings.size else 0.0
     st.metric("Avg Agent Rating", f"{avg_rating:.2f}")
 
 # Tabs for different analyses
@@ -179,15 +303,18 @@ tab1, tab2, tab3, tab4, tab5 = st.tabs([
     "📋 Recommendations"
 ])
 
-with tab1:
+# Each tab body is a fragment: interacting with widgets inside one tab
+# reruns just that fragment instead of the whole script
+@st.fragment
+def render_tab1(filtered):
     st.subheader("Overall Delivery Performance")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         # Delivery time distribution
         fig = px.histogram(
-            filtered_df, 
+            filtered,
             x='Delivery_Time',
             nbins=30,
             title='Delivery Time Distribution',
@@ -195,76 +322,70 @@ with tab1:
         )
         fig.update_layout(xaxis_title='Delivery Time (min)', yaxis_title='Count')
         st.plotly_chart(fig, use_container_width=True)
-    
+
     with col2:
         # Delivery type breakdown
-        delivery_type_counts = filtered_df['Delivery_Type'].value_counts()
+        delivery_type_counts = filtered['Delivery_Type'].value_counts()
         fig = px.pie(
             values=delivery_type_counts.values,
             names=delivery_type_counts.index,
             title='Delivery Type Distribution'
         )
         st.plotly_chart(fig, use_container_width=True)
-    
+
     # Category performance
     st.subheader("Category Performance Analysis")
-    category_stats = filtered_df.groupby('Category').agg({
-        'Delivery_Time': ['mean', 'count'],
-        'Agent_Rating': 'mean'
-    }).round(2)
-    category_stats.columns = ['Avg_Delivery_Time', 'Order_Count', 'Avg_Rating']
-    category_stats = category_stats.sort_values('Avg_Delivery_Time', ascending=False)
-    
+    category_stats = aggs['category']
+
     st.dataframe(category_stats, use_container_width=True)
 
-with tab2:
+@st.fragment
+def render_tab2(filtered):
     st.subheader("Agent Performance Analysis")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         # Age vs Performance
         fig = px.scatter(
-            filtered_df,
+            scatter_df,
             x='Agent_Age',
             y='Delivery_Time',
             color='Agent_Rating',
             size='Distance_km',
             title='Agent Age vs Delivery Performance',
-            hover_data=['Vehicle', 'Area']
+            hover_data=['Vehicle', 'Area'],
+            render_mode='webgl'
         )
         st.plotly_chart(fig, use_container_width=True)
-    
+        if len(filtered) > MAX_SCATTER_POINTS:
+            st.caption(f"Showing a sample of {MAX_SCATTER_POINTS:,} of {len(filtered):,} orders")
+
     with col2:
         # Rating distribution
         fig = px.histogram(
-            filtered_df,
+            filtered,
             x='Agent_Rating',
             nbins=20,
             title='Agent Rating Distribution'
         )
         st.plotly_chart(fig, use_container_width=True)
-    
+
     # Top/Bottom performers
     st.subheader("Agent Efficiency Ranking")
-    agent_efficiency = filtered_df.groupby('Agent_Age').agg({
-        'Delivery_Time': 'mean',
-        'Agent_Rating': 'mean',
-        'Order_ID': 'count'
-    }).rename(columns={'Order_ID': 'Total_Orders'})
-    agent_efficiency['Efficiency_Score'] = agent_efficiency['Delivery_Time'] / filtered_df.groupby('Agent_Age')['Distance_km'].mean()
-    agent_efficiency = agent_efficiency.sort_values('Efficiency_Score')
-    
+    agent_efficiency = compute_agent_efficiency(filtered)
+
     st.dataframe(agent_efficiency, use_container_width=True)
 
-with tab3:
+@st.fragment
+def render_tab3(filtered):
     st.subheader("Weather & Traffic Impact Analysis")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         # Weather impact
-        weather_impact = filtered_df.groupby('Weather')['Delivery_Time'].mean().sort_values(ascending=False)
+        weather_impact = aggs['weather']
         fig = px.bar(
             x=weather_impact.index,
             y=weather_impact.values,
@@ -272,10 +393,10 @@ with tab3:
             labels={'x': 'Weather', 'y': 'Avg Delivery Time (min)'}
         )
         st.plotly_chart(fig, use_container_width=True)
-    
+
     with col2:
         # Traffic impact
-        traffic_impact = filtered_df.groupby('Traffic')['Delivery_Time'].mean().sort_values(ascending=False)
+        traffic_impact = aggs['traffic']
         fig = px.bar(
             x=traffic_impact.index,
             y=traffic_impact.values,
@@ -283,16 +404,11 @@ with tab3:
             labels={'x': 'Traffic', 'y': 'Avg Delivery Time (min)'}
         )
         st.plotly_chart(fig, use_container_width=True)
-    
+
     # Weather-Traffic combination heatmap
     st.subheader("Weather-Traffic Combination Impact")
-    heatmap_data = filtered_df.pivot_table(
-        values='Delivery_Time',
-        index='Weather',
-        columns='Traffic',
-        aggfunc='mean'
-    ).fillna(0)
-    
+    heatmap_data = aggs['heatmap']
+
     fig = px.imshow(
         heatmap_data,
         title='Delivery Time Heatmap: Weather vs Traffic',
@@ -301,91 +417,124 @@ with tab3:
     )
     st.plotly_chart(fig, use_container_width=True)
 
-with tab4:
+@st.fragment
+def render_tab4(filtered):
     st.subheader("Geographic Analysis")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
-        # Store locations map - FIXED
-        if all(col in filtered_df.columns for col in ['Store_Latitude', 'Store_Longitude']):
-            # Create a copy with the correct column names that Streamlit expects
-            map_data = filtered_df[['Store_Latitude', 'Store_Longitude']].dropna().copy()
+        # Store locations map - hexagon-binned so the GPU aggregates
+        # points into cells instead of drawing a marker per row
+        if all(col in filtered.columns for col in ['Store_Latitude', 'Store_Longitude']):
+            map_data = filtered[['Store_Latitude', 'Store_Longitude']].dropna().copy()
             map_data = map_data.rename(columns={
                 'Store_Latitude': 'lat',
                 'Store_Longitude': 'lon'
             })
-            st.map(map_data)
+            st.pydeck_chart(pdk.Deck(
+                layers=[pdk.Layer(
+                    'HexagonLayer',
+                    map_data,
+                    get_position='[lon, lat]',
+                    radius=500,
+                    extruded=True
+                )],
+                initial_view_state=pdk.ViewState(
+                    latitude=map_data['lat'].mean(),
+                    longitude=map_data['lon'].mean(),
+                    zoom=10
+                )
+            ))
             st.caption(f"📍 Showing {len(map_data)} store locations")
         else:
             st.info("📍 Map data not available - missing latitude/longitude columns")
-    
+
     with col2:
         # Distance vs Delivery Time
-        if 'Distance_km' in filtered_df.columns:
+        if 'Distance_km' in filtered.columns:
             fig = px.scatter(
-                filtered_df,
+                scatter_df,
                 x='Distance_km',
                 y='Delivery_Time',
                 color='Area',
                 title='Distance vs Delivery Time',
-                hover_data=['Weather', 'Traffic']
+                hover_data=['Weather', 'Traffic'],
+                render_mode='webgl'
             )
             st.plotly_chart(fig, use_container_width=True)
+            if len(filtered) > MAX_SCATTER_POINTS:
+                st.caption(f"Showing a sample of {MAX_SCATTER_POINTS:,} of {len(filtered):,} orders")
         else:
             st.info("📏 Distance data not available")
-    
+
     # Area performance
-    area_performance = filtered_df.groupby('Area').agg({
-        'Delivery_Time': 'mean',
-        'Agent_Rating': 'mean',
-        'Order_ID': 'count'
-    }).rename(columns={'Order_ID': 'Order_Count'}).round(2)
-    
+    area_performance = aggs['area']
+
     st.dataframe(area_performance, use_container_width=True)
 
-with tab5:
+@st.fragment
+def render_tab5(filtered):
     st.subheader("📋 Data-Driven Recommendations")
-    
+
     # Generate recommendations based on analysis
     st.info("**Based on the current filtered data, here are your recommendations:**")
-    
+
     # Recommendation 1: Weather contingencies
-    if not filtered_df.empty:
-        worst_weather = filtered_df.groupby('Weather')['Delivery_Time'].mean().idxmax()
+    if not filtered.empty:
+        worst_weather = aggs['weather'].idxmax()
         st.warning(f"**Weather Alert**: {worst_weather} conditions cause the longest delays. Consider:")
         st.markdown("- Pre-position additional agents during forecasted bad weather")
         st.markdown("- Implement weather-based surge pricing")
         st.markdown("- Adjust delivery time expectations for customers")
-        
+
         # Recommendation 2: Vehicle optimization
-        vehicle_efficiency = filtered_df.groupby('Vehicle')['Delivery_Time'].mean()
+        vehicle_efficiency = aggs['vehicle']
         best_vehicle = vehicle_efficiency.idxmin()
         worst_vehicle = vehicle_efficiency.idxmax()
         st.success(f"**Vehicle Strategy**: {best_vehicle} performs best. Consider reallocating from {worst_vehicle}")
-        
+
         # Recommendation 3: Category management
-        slowest_category = filtered_df.groupby('Category')['Delivery_Time'].mean().idxmax()
+        slowest_category = aggs['category']['Avg_Delivery_Time'].idxmax()
         st.error(f"**Category Focus**: {slowest_category} has the longest delivery times. Review:")
         st.markdown("- Packaging requirements")
         st.markdown("- Handling procedures")
         st.markdown("- Customer expectations")
     else:
         st.info("No data available for recommendations")
-    
-    # Download filtered data
+
+    # Download filtered data - only built when the user asks, so the
+    # CSV string isn't regenerated on every rerun
     st.subheader("📥 Export Data")
-    if not filtered_df.empty:
-        csv = filtered_df.to_csv(index=False)
-        st.download_button(
-            label="Download Filtered Data as CSV",
-            data=csv,
-            file_name=f"filtered_delivery_data_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv"
-        )
+    if not filtered.empty:
+        if st.button("Prepare CSV Export"):
+            buf = io.BytesIO()
+            filtered.to_csv(buf, index=False)
+            buf.seek(0)
+            st.download_button(
+                label="Download Filtered Data as CSV",
+                data=buf,
+                file_name=f"filtered_delivery_data_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
     else:
         st.info("No data available for export")
 
+with tab1:
+    render_tab1(filtered_df)
+
+with tab2:
+    render_tab2(filtered_df)
+
+with tab3:
+    render_tab3(filtered_df)
+
+with tab4:
+    render_tab4(filtered_df)
+
+with tab5:
+    render_tab5(filtered_df)
+
 # Footer
 st.markdown("---")
 st.markdown("📊 *Last-Mile Delivery Analytics Dashboard* | Built with Streamlit")
\ No newline at end of file